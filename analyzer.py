@@ -0,0 +1,148 @@
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+REQUEST_BUCKET_CAPACITY = 86400  # seconds of per-second request counts kept
+
+
+class Analyzer:
+    """Calculates real-time metrics from results"""
+
+    # Fixed counter set, so slots keep updates to plain attribute stores
+    __slots__ = (
+        "results",
+        "malformed_lines",
+        "buckets",
+        "newest_bucket_second",
+        "peak_requests_per_second",
+        "first_second",
+        "last_second",
+    )
+
+    def __init__(self) -> None:
+        # Per-worker arrays hold the request, error and response time totals
+        self.results = WorkerResults()
+        self.malformed_lines = 0
+        # Ring buffer of request counts indexed by epoch_second % REQUEST_BUCKET_CAPACITY
+        self.buckets = np.zeros(REQUEST_BUCKET_CAPACITY, dtype=np.int64)
+        self.newest_bucket_second: Optional[int] = None
+        self.peak_requests_per_second = 0
+        self.first_second: Optional[int] = None
+        self.last_second: Optional[int] = None
+
+    def update_metrics(self, new_data: Dict) -> None:
+        """Update metrics with new data from workers"""
+        self.results.add(new_data["worker_id"], new_data)
+        self.malformed_lines += new_data.get("malformed_lines", 0)
+        request_count_per_second = new_data.get("request_count_per_second")
+        if request_count_per_second and request_count_per_second["seconds"]:
+            self._add_request_counts(
+                np.asarray(request_count_per_second["seconds"], dtype=np.int64),
+                np.asarray(request_count_per_second["counts"], dtype=np.int64),
+            )
+        # The span covers every well-formed line, so error-only periods count too
+        first_second = new_data.get("first_second")
+        if first_second is not None and (
+            self.first_second is None or first_second < self.first_second
+        ):
+            self.first_second = first_second
+        last_second = new_data.get("last_second")
+        if last_second is not None and (self.last_second is None or last_second > self.last_second):
+            self.last_second = last_second
+
+    def _add_request_counts(self, seconds: np.ndarray, counts: np.ndarray) -> None:
+        newest = int(seconds.max())
+        if self.newest_bucket_second is None or newest > self.newest_bucket_second:
+            if self.newest_bucket_second is not None:
+                # Clear the slots being recycled for seconds newer than any seen so far
+                recycled = np.arange(
+                    max(self.newest_bucket_second + 1, newest - REQUEST_BUCKET_CAPACITY + 1),
+                    newest + 1,
+                )
+                self.buckets[recycled % REQUEST_BUCKET_CAPACITY] = 0
+            self.newest_bucket_second = newest
+
+        # Seconds older than the ring window are counted in the totals only
+        in_window = seconds > self.newest_bucket_second - REQUEST_BUCKET_CAPACITY
+        if not in_window.all():
+            seconds, counts = seconds[in_window], counts[in_window]
+        if seconds.size:
+            slots = seconds % REQUEST_BUCKET_CAPACITY
+            np.add.at(self.buckets, slots, counts)
+            self.peak_requests_per_second = max(
+                self.peak_requests_per_second, int(self.buckets[slots].max())
+            )
+
+    def get_current_metrics(self) -> Dict:
+        """Return current calculated metrics"""
+        total_requests, total_errors, total_response_time = self.results.totals()
+        # Seconds spanned by the well-formed lines seen so far, inclusive
+        duration = (
+            self.last_second - self.first_second + 1
+            if self.first_second is not None and self.last_second is not None
+            else 0
+        )
+        return {
+            "total_requests": total_requests,
+            "avg_response_time": (
+                total_response_time / total_requests if total_requests else 0.0
+            ),
+            "error_rate": total_errors * 60 / duration if duration else 0.0,
+            "requests_per_second": total_requests / duration if duration else 0.0,
+            "peak_requests_per_second": self.peak_requests_per_second,
+            "malformed_lines": self.malformed_lines,
+        }
+
+
+class WorkerResults:
+    """Per-worker result totals kept as parallel arrays indexed by worker slot"""
+
+    __slots__ = ("slots", "chunk_counts", "request_counts", "error_counts", "total_response_times")
+
+    def __init__(self, capacity: int = 64):
+        self.slots: Dict[str, int] = {}
+        self.chunk_counts = np.zeros(capacity, dtype=np.int64)
+        self.request_counts = np.zeros(capacity, dtype=np.int64)
+        self.error_counts = np.zeros(capacity, dtype=np.int64)
+        self.total_response_times = np.zeros(capacity, dtype=np.int64)
+
+    def add(self, worker_id: str, new_data: Dict) -> None:
+        """Add one chunk's results to the reporting worker's totals"""
+        slot = self.slots.get(worker_id)
+        if slot is None:
+            slot = self.slots[worker_id] = len(self.slots)
+            if slot == self.chunk_counts.size:
+                self._grow()
+        self.chunk_counts[slot] += 1
+        self.request_counts[slot] += new_data.get("request_count", 0)
+        self.error_counts[slot] += new_data.get("error_count", 0)
+        self.total_response_times[slot] += new_data.get("total_response_time", 0)
+
+    def _grow(self) -> None:
+        for name in ("chunk_counts", "request_counts", "error_counts", "total_response_times"):
+            values = getattr(self, name)
+            setattr(self, name, np.concatenate([values, np.zeros_like(values)]))
+
+    def totals(self) -> Tuple[int, int, int]:
+        """Return the cluster-wide request, error and response time totals"""
+        return (
+            int(self.request_counts.sum()),
+            int(self.error_counts.sum()),
+            int(self.total_response_times.sum()),
+        )
+
+    def summary(self) -> Dict:
+        """Return each worker's chunk, request, error and response time totals"""
+        return {
+            worker_id: {
+                "chunks_processed": int(self.chunk_counts[slot]),
+                "total_requests": int(self.request_counts[slot]),
+                "total_errors": int(self.error_counts[slot]),
+                "avg_response_time": (
+                    int(self.total_response_times[slot]) / int(self.request_counts[slot])
+                    if self.request_counts[slot]
+                    else 0.0
+                ),
+            }
+            for worker_id, slot in self.slots.items()
+        }
@@ -1,31 +1,266 @@
 import argparse
+import asyncio
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Set
+
+import aiohttp
+import orjson
+from aiohttp import web
+
+try:
+    import uvloop
+except ImportError:  # uvloop does not support Windows
+    uvloop = None  # type: ignore[assignment]
+
+from analyzer import Analyzer
+from logging_config import setup_logging
+
+CHUNK_SIZE = 4 * 1024 * 1024  # bytes
+HEARTBEAT_TIMEOUT = 15  # seconds without a heartbeat before a worker is presumed dead
+
+logger = logging.getLogger(__name__)
+
 
 class Coordinator:
     """Manages workers and aggregates results"""
     
     def __init__(self, port: int):
-        print(f"Starting coordinator on port {port}")
-        self.workers = {}
-        self.results = {}
+        logger.info("Starting coordinator on port %d", port)
+        self.workers: Dict[str, dict] = {}
+        self.failed_chunks: Dict[str, str] = {}
+        # Workers resend batches whose delivery was not confirmed, so apply each chunk once
+        self.applied_chunks: Set[str] = set()
+        # Chunks each worker accepted but has not reported yet, by worker and chunk id
+        self.in_flight: Dict[str, Dict[str, dict]] = {}
+        self._job_count = 0
+        self.analyzer = Analyzer()
         self.port = port
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._monitor_task: Optional[asyncio.Task] = None
 
     def start(self) -> None:
         """Start coordinator server"""
-        print(f"Starting coordinator on port {self.port}...")
-        pass
+        logger.info("Starting coordinator on port %d...", self.port)
+        app = web.Application()
+        app.router.add_post("/heartbeat", self.heartbeat_handler)
+        app.router.add_post("/report_results", self.report_results)
+        app.router.add_get("/metrics", self.metrics_handler)
+        app.router.add_post("/process_file", self.process_file_handler)
+        app.on_startup.append(self._on_startup)
+        app.on_shutdown.append(self._on_shutdown)
+        app.on_shutdown.append(self._close_session)
+        web.run_app(
+            app,
+            port=self.port,
+            access_log=None,
+            loop=uvloop.new_event_loop() if uvloop else None,
+        )
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        # One pooled session for all dispatches instead of a connector per request
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=256, limit_per_host=32, ttl_dns_cache=300),
+                # A worker that hangs on an assignment is treated like one that refused it
+                timeout=aiohttp.ClientTimeout(total=HEARTBEAT_TIMEOUT),
+            )
+        return self._session
+
+    async def _close_session(self, app: web.Application) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _on_startup(self, app: web.Application) -> None:
+        self._monitor_task = asyncio.create_task(self._monitor_workers())
+
+    async def _on_shutdown(self, app: web.Application) -> None:
+        if self._monitor_task is not None:
+            self._monitor_task.cancel()
+
+    async def _monitor_workers(self) -> None:
+        while True:
+            await asyncio.sleep(HEARTBEAT_TIMEOUT / 3)
+            deadline = time.time() - HEARTBEAT_TIMEOUT
+            for worker_id, worker in list(self.workers.items()):
+                if worker["last_heartbeat"] < deadline:
+                    logger.warning("Worker %s missed its heartbeats", worker_id)
+                    await self.handle_worker_failure(worker_id)
 
-    async def distribute_work(self, filepath: str) -> None:
+    async def heartbeat_handler(self, request: web.Request) -> web.Response:
+        """Register a worker or refresh its last-seen time"""
+        try:
+            data = orjson.loads(await request.read())
+            worker_id, url = data["worker_id"], data["url"]
+            if not isinstance(worker_id, str) or not isinstance(url, str):
+                raise TypeError("worker_id and url must be strings")
+        except (KeyError, TypeError, ValueError) as e:
+            raise web.HTTPBadRequest(text=f"Invalid heartbeat: {e!r}")
+        self.workers[worker_id] = {"url": url, "last_heartbeat": time.time()}
+        return web.Response(body=orjson.dumps({"status": "ok"}), content_type="application/json")
+
+    async def report_results(self, request: web.Request) -> web.Response:
+        """Accept the metrics of processed chunks from a worker, singly or batched"""
+        data = orjson.loads(await request.read())
+        for item in data["batch"] if "batch" in data else [data]:
+            self._settle(item["chunk_id"])
+            if item["chunk_id"] in self.applied_chunks:
+                logger.debug("Skipping repeated results for chunk %s", item["chunk_id"])
+                continue
+            if "error" in item:
+                logger.warning(
+                    "Worker %s failed chunk %s: %s",
+                    item["worker_id"],
+                    item["chunk_id"],
+                    item["error"],
+                )
+                self.failed_chunks[item["chunk_id"]] = item["error"]
+                continue
+            logger.debug(
+                "Received results for chunk %s from worker %s", item["chunk_id"], item["worker_id"]
+            )
+            self.analyzer.update_metrics(item)
+            self.applied_chunks.add(item["chunk_id"])
+        return web.Response(body=orjson.dumps({"status": "ok"}), content_type="application/json")
+
+    async def metrics_handler(self, request: web.Request) -> web.Response:
+        """Return the current aggregated metrics"""
+        metrics = self.analyzer.get_current_metrics()
+        metrics["workers"] = self.analyzer.results.summary()
+        metrics["failed_chunks"] = self.failed_chunks
+        # Totals are incomplete while chunks are still out with workers
+        metrics["pending_chunks"] = sum(len(chunks) for chunks in self.in_flight.values())
+        return web.Response(body=orjson.dumps(metrics), content_type="application/json")
+
+    async def process_file_handler(self, request: web.Request) -> web.Response:
+        """Start distributing one or more log files across the registered workers"""
+        try:
+            data = orjson.loads(await request.read())
+            filepaths = data["filepaths"] if "filepaths" in data else [data["filepath"]]
+            if not isinstance(filepaths, list) or not all(
+                isinstance(filepath, str) for filepath in filepaths
+            ):
+                raise TypeError("filepaths must be a list of strings")
+        except (KeyError, TypeError, ValueError) as e:
+            raise web.HTTPBadRequest(text=f"Invalid file request: {e!r}")
+        try:
+            failed = await self.assign_work(filepaths)
+        except RuntimeError as e:
+            raise web.HTTPServiceUnavailable(text=str(e))
+        except OSError as e:
+            # Only the size lookup raises OSError; dispatch failures are reported per chunk
+            raise web.HTTPBadRequest(text=str(e))
+        return web.Response(
+            body=orjson.dumps({"status": "started", "failed_chunks": failed}),
+            content_type="application/json",
+        )
+
+    async def distribute_work(self, filepath: str) -> List[str]:
         """Split file and assign chunks to workers"""
-        pass
+        return await self.assign_work([filepath])
+
+    async def assign_work(self, filepaths: List[str]) -> List[str]:
+        """Split several files and assign their chunks to workers round-robin
+
+        Returns the ids of chunks that no live worker accepted.
+        """
+        if not self.workers:
+            raise RuntimeError("No workers registered")
+        # Stat all files concurrently off the event loop
+        loop = asyncio.get_running_loop()
+        sizes = await asyncio.gather(
+            *(loop.run_in_executor(None, os.path.getsize, filepath) for filepath in filepaths)
+        )
+        # Chunk ids are scoped to the job, so processing a file again counts it again
+        self._job_count += 1
+        job = self._job_count
+        chunks: List[dict] = [
+            {
+                "chunk_id": f"{job}:{filepath}:{start}",
+                "filepath": filepath,
+                "start": start,
+                "size": CHUNK_SIZE,
+            }
+            for filepath, size in zip(filepaths, sizes)
+            for start in range(0, size, CHUNK_SIZE)
+        ]
+        return await self._dispatch(chunks)
+
+    async def _dispatch(self, chunks: List[dict]) -> List[str]:
+        # Each round drops the workers that refused a chunk and retries their chunks on the rest
+        while chunks and self.workers:
+            worker_ids = list(self.workers)
+            assigned = [worker_ids[index % len(worker_ids)] for index in range(len(chunks))]
+            # Track chunks before sending, as a fast worker may report before gather returns
+            for worker_id, chunk in zip(assigned, chunks):
+                self.in_flight.setdefault(worker_id, {})[chunk["chunk_id"]] = chunk
+            outcomes = await asyncio.gather(
+                *(
+                    self.send_chunk_to_worker(worker_id, chunk)
+                    for worker_id, chunk in zip(assigned, chunks)
+                ),
+                return_exceptions=True,
+            )
+            retry = []
+            failed_workers: List[str] = []
+            for worker_id, chunk, outcome in zip(assigned, chunks, outcomes):
+                if isinstance(outcome, BaseException):
+                    logger.warning(
+                        "Failed to assign chunk %s to worker %s: %s",
+                        chunk["chunk_id"],
+                        worker_id,
+                        str(outcome) or type(outcome).__name__,
+                    )
+                    self.in_flight.get(worker_id, {}).pop(chunk["chunk_id"], None)
+                    if worker_id not in failed_workers:
+                        failed_workers.append(worker_id)
+                    retry.append(chunk)
+            # Chunks a refusing worker accepted earlier are presumed lost with it
+            for worker_id in failed_workers:
+                retry.extend(self._drop_worker(worker_id))
+            chunks = retry
+        for chunk in chunks:
+            self.failed_chunks[chunk["chunk_id"]] = "No live worker accepted the chunk"
+        return [chunk["chunk_id"] for chunk in chunks]
+
+    async def send_chunk_to_worker(self, worker_id: str, chunk: dict) -> None:
+        """Assign one chunk to a worker"""
+        session = await self._get_session()
+        async with session.post(
+            f"{self.workers[worker_id]['url']}/process_chunk",
+            data=orjson.dumps(chunk),
+            headers={"Content-Type": "application/json"},
+        ) as response:
+            response.raise_for_status()
+
+    def _settle(self, chunk_id: str) -> None:
+        # A chunk is done once any worker reports it, including one it was reassigned from
+        for chunks in self.in_flight.values():
+            chunks.pop(chunk_id, None)
+
+    def _drop_worker(self, worker_id: str) -> List[dict]:
+        if self.workers.pop(worker_id, None) is not None:
+            logger.warning("Dropped unreachable worker %s", worker_id)
+        return list(self.in_flight.pop(worker_id, {}).values())
 
     async def handle_worker_failure(self, worker_id: str) -> None:
         """Reassign work from failed worker"""
-        pass
+        orphaned = self._drop_worker(worker_id)
+        if orphaned:
+            logger.warning("Reassigning %d chunks from worker %s", len(orphaned), worker_id)
+            await self._dispatch(orphaned)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Log Analyzer Coordinator")
     parser.add_argument("--port", type=int, default=8000, help="Coordinator port")
+    parser.add_argument("--log-level", type=str, default="INFO", help="Logging level")
     args = parser.parse_args()
 
-    coordinator = Coordinator(port=args.port)
-    coordinator.start()
+    listener = setup_logging(args.log_level)
+    try:
+        coordinator = Coordinator(port=args.port)
+        coordinator.start()
+    finally:
+        listener.stop()
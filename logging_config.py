@@ -0,0 +1,21 @@
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+def setup_logging(level: str = "INFO") -> QueueListener:
+    """Route all logging through a queue drained by a background thread.
+
+    Callers only enqueue records, so formatting and writing to stderr never
+    block the event loop. Stop the returned listener on exit to flush it.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    listener = QueueListener(log_queue, handler)
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.handlers[:] = [QueueHandler(log_queue)]
+    listener.start()
+    return listener
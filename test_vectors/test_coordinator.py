@@ -0,0 +1,116 @@
+import asyncio
+
+import aiohttp
+import orjson
+import pytest
+from aiohttp import web
+
+from coordinator import CHUNK_SIZE, Coordinator
+
+
+class _Request:
+    """Just enough of aiohttp's request for handlers that only read the body"""
+
+    def __init__(self, payload) -> None:
+        self.payload = payload
+
+    async def read(self) -> bytes:
+        return self.payload if isinstance(self.payload, bytes) else orjson.dumps(self.payload)
+
+
+def _call(handler, payload):
+    return asyncio.run(handler(_Request(payload)))
+
+
+def _chunk_result(chunk_id: str, requests: int) -> dict:
+    return {
+        "worker_id": "w1",
+        "chunk_id": chunk_id,
+        "line_count": requests,
+        "malformed_lines": 0,
+        "request_count": requests,
+        "error_count": 0,
+        "total_response_time": 100 * requests,
+        "first_second": 0,
+        "last_second": 9,
+        "request_count_per_second": {"seconds": [0], "counts": [requests]},
+    }
+
+
+def test_resent_results_are_applied_once():
+    coordinator = Coordinator(port=0)
+    batch = {"batch": [_chunk_result("1:a.log:0", 10), _chunk_result("1:a.log:4194304", 5)]}
+    _call(coordinator.report_results, batch)
+    # A batch whose response was lost comes back with a new chunk appended
+    batch["batch"].append(_chunk_result("1:b.log:0", 1))
+    _call(coordinator.report_results, batch)
+    metrics = coordinator.analyzer.get_current_metrics()
+    assert metrics["total_requests"] == 16
+    assert coordinator.analyzer.results.summary()["w1"]["chunks_processed"] == 3
+
+
+def _coordinator_with_workers(*worker_ids: str) -> Coordinator:
+    coordinator = Coordinator(port=0)
+    for worker_id in worker_ids:
+        _call(coordinator.heartbeat_handler, {"worker_id": worker_id, "url": f"http://{worker_id}"})
+    return coordinator
+
+
+def _record_sends(monkeypatch, coordinator: Coordinator, refusing: tuple = ()) -> list:
+    sent = []
+
+    async def send(worker_id: str, chunk: dict) -> None:
+        if worker_id in refusing:
+            raise aiohttp.ClientConnectionError("refused")
+        sent.append((worker_id, chunk["chunk_id"]))
+
+    monkeypatch.setattr(coordinator, "send_chunk_to_worker", send)
+    return sent
+
+
+@pytest.mark.parametrize(
+    "handler, payload",
+    [
+        ("heartbeat_handler", b"not json"),
+        ("heartbeat_handler", {}),
+        ("heartbeat_handler", {"worker_id": 1, "url": "http://w1"}),
+        ("process_file_handler", b"not json"),
+        ("process_file_handler", {}),
+        ("process_file_handler", {"filepaths": "a.log"}),
+        ("process_file_handler", [1]),
+    ],
+)
+def test_invalid_requests_are_rejected(handler, payload):
+    coordinator = _coordinator_with_workers("w1")
+    with pytest.raises(web.HTTPBadRequest):
+        _call(getattr(coordinator, handler), payload)
+
+
+def test_refused_chunks_move_to_live_workers(monkeypatch, tmp_path):
+    path = tmp_path / "big.log"
+    with open(path, "wb") as file:
+        file.truncate(3 * CHUNK_SIZE)
+    coordinator = _coordinator_with_workers("w1", "w2")
+    sent = _record_sends(monkeypatch, coordinator, refusing=("w2",))
+    assert asyncio.run(coordinator.distribute_work(str(path))) == []
+    assert [worker_id for worker_id, _ in sent] == ["w1"] * 3
+    assert list(coordinator.workers) == ["w1"]
+    assert len(coordinator.in_flight["w1"]) == 3
+
+
+def test_chunks_of_a_dead_worker_are_reassigned(monkeypatch):
+    coordinator = _coordinator_with_workers("w1", "w2")
+    sent = _record_sends(monkeypatch, coordinator)
+    chunks = [{"chunk_id": f"1:a.log:{start}"} for start in range(3)]
+    asyncio.run(coordinator._dispatch(chunks))
+    # w1 reports one of its two chunks and then stops sending heartbeats
+    _call(coordinator.report_results, _chunk_result("1:a.log:0", 1))
+    sent.clear()
+    asyncio.run(coordinator.handle_worker_failure("w1"))
+    assert sent == [("w2", "1:a.log:2")]
+    assert "w1" not in coordinator.in_flight
+    assert sorted(coordinator.in_flight["w2"]) == ["1:a.log:1", "1:a.log:2"]
+    # The last worker dying leaves its chunks recorded as failed
+    asyncio.run(coordinator.handle_worker_failure("w2"))
+    assert sorted(coordinator.failed_chunks) == ["1:a.log:1", "1:a.log:2"]
+    assert coordinator.in_flight == {}
@@ -0,0 +1,320 @@
+import asyncio
+import calendar
+import mmap
+import os
+import random
+import re
+from typing import Any, Dict
+
+import aiohttp
+import numpy as np
+import pytest
+
+from analyzer import REQUEST_BUCKET_CAPACITY, Analyzer
+from expected import EXPECTED_METRICS
+from worker import REPORT_BATCH_SIZE, Worker, _chunk_bounds, _parse_chunk, _process_file_chunk
+
+LOG_DIR = os.path.join(os.path.dirname(__file__), "logs")
+LOG_FILES = sorted(EXPECTED_METRICS)
+COUNTERS = ("line_count", "malformed_lines", "request_count", "error_count", "total_response_time")
+
+LINE_PATTERN = re.compile(
+    rb"^(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2}):(\d{2})\.\d{3} ([A-Za-z0-9_]+) (.*)$"
+)
+REQUEST_PATTERN = re.compile(rb"processed in (\d+)ms")
+
+
+def _scan_bytes(data: bytes) -> dict:
+    return _parse_chunk(np.frombuffer(data, dtype=np.uint8))
+
+
+def _merged(results: list) -> Analyzer:
+    analyzer = Analyzer()
+    for result in results:
+        analyzer.update_metrics({"worker_id": "w", **result})
+    return analyzer
+
+
+def _reference_scan(data: bytes) -> dict:
+    """Plain Python reading of the primary log format, line by line"""
+    metrics: Dict[str, Any] = dict.fromkeys(COUNTERS, 0)
+    seconds = []
+    per_second: dict = {}
+    for line in data.split(b"\n"):
+        if not line.strip():
+            continue
+        metrics["line_count"] += 1
+        match = LINE_PATTERN.match(line)
+        year, month, day, hour, minute, second = (
+            (int(field) for field in match.groups()[:6]) if match else (0,) * 6
+        )
+        if (
+            match is None
+            or not 1 <= month <= 12
+            or not 1 <= day <= calendar.monthrange(year, month)[1]
+            or hour >= 24
+            or minute >= 60
+            or second >= 61
+        ):
+            metrics["malformed_lines"] += 1
+            continue
+        epoch = calendar.timegm((year, month, day, hour, minute, 0, 0, 0, 0)) + second
+        seconds.append(epoch)
+        metrics["error_count"] += match.group(7) == b"ERROR"
+        request = REQUEST_PATTERN.search(match.group(8))
+        if request is not None:
+            metrics["request_count"] += 1
+            metrics["total_response_time"] += int(request.group(1))
+            per_second[epoch] = per_second.get(epoch, 0) + 1
+    metrics["first_second"] = min(seconds, default=None)
+    metrics["last_second"] = max(seconds, default=None)
+    metrics["request_count_per_second"] = {
+        "seconds": sorted(per_second),
+        "counts": [per_second[second] for second in sorted(per_second)],
+    }
+    return metrics
+
+
+def _random_line(rng: random.Random) -> bytes:
+    kind = rng.random()
+    if kind < 0.05:
+        return rng.choice([b"", b"   ", b"\t"])
+    if kind < 0.12:
+        return rng.choice([b"garbage", b"2024-01-24 10:15", b"INFO Request processed in 5ms"])
+    fields = [
+        rng.randint(1970, 2100),
+        rng.randint(1, 12),
+        rng.randint(1, 28),
+        rng.randint(0, 23),
+        rng.randint(0, 59),
+        rng.randint(0, 60),
+    ]
+    if kind < 0.25:
+        # One field pushed out of range
+        field = rng.randrange(1, 6)
+        fields[field] = rng.choice([0, 13, 24, 32, 60, 61, 99])
+    timestamp = "%04d-%02d-%02d %02d:%02d:%02d.%03d" % (*fields, rng.randint(0, 999))
+    level = rng.choice(["INFO", "ERROR", "WARN", "DEBUG", "ERRORS"])
+    message = rng.choice(
+        [
+            "Request processed in %dms" % rng.randint(0, 5000),
+            "Database connection failed",
+            "processed in ms then processed in %dms" % rng.randint(0, 99),
+            "processed in 12 ms",
+        ]
+    )
+    return f"{timestamp} {level} {message}".encode()
+
+
+@pytest.mark.parametrize("name", LOG_FILES)
+def test_log_vectors(name):
+    expected = EXPECTED_METRICS[name]
+    path = os.path.join(LOG_DIR, name)
+    metrics = _merged([_process_file_chunk(path, 0, os.path.getsize(path))]).get_current_metrics()
+    # error_rate and requests_per_second are not checked: every line in these vectors is
+    # stamped 10:15:32 or 10:15:33, so the span is one or two seconds rather than the
+    # 60-100 seconds those expectations assume
+    assert metrics["total_requests"] == expected["total_requests"]
+    assert metrics["avg_response_time"] == pytest.approx(expected["avg_response_time"])
+    assert metrics["malformed_lines"] == expected.get("malformed_lines", 0)
+
+
+def test_error_spike_log():
+    path = os.path.join(LOG_DIR, "error_spike.log")
+    result = _process_file_chunk(path, 0, os.path.getsize(path))
+    assert result["error_count"] == 50
+
+
+@pytest.mark.parametrize("name", LOG_FILES)
+@pytest.mark.parametrize("chunk_size", [37, 1000, 65536])
+def test_chunks_sum_to_whole_file(name, chunk_size):
+    path = os.path.join(LOG_DIR, name)
+    size = os.path.getsize(path)
+    whole = _process_file_chunk(path, 0, size)
+    chunks = [_process_file_chunk(path, start, chunk_size) for start in range(0, size, chunk_size)]
+    for counter in COUNTERS:
+        assert sum(chunk[counter] for chunk in chunks) == whole[counter]
+    merged, single = _merged(chunks), _merged([whole])
+    assert merged.get_current_metrics() == single.get_current_metrics()
+    assert np.array_equal(merged.buckets, single.buckets)
+
+
+@pytest.mark.parametrize(
+    "timestamp",
+    [
+        "2024-00-24 10:15:32.123",
+        "2024-13-24 10:15:32.123",
+        "2024-01-00 10:15:32.123",
+        "2024-01-32 10:15:32.123",
+        "2023-02-29 10:15:32.123",
+        "2024-01-24 24:15:32.123",
+        "2024-01-24 10:60:32.123",
+        "2024-01-24 10:15:61.123",
+    ],
+)
+def test_out_of_range_timestamp_is_malformed(timestamp):
+    result = _scan_bytes(f"{timestamp} INFO Request processed in 127ms\n".encode())
+    assert result["malformed_lines"] == 1
+    assert result["request_count"] == 0
+    assert result["first_second"] is None
+
+
+def test_leap_second_and_leap_day_are_accepted():
+    result = _scan_bytes(
+        b"2024-02-29 23:59:60.000 INFO Request processed in 5ms\n"
+        b"2024-03-01 00:00:00.000 INFO Request processed in 7ms\n"
+    )
+    assert result["malformed_lines"] == 0
+    assert result["request_count"] == 2
+    # The leap second folds into the following second
+    assert result["request_count_per_second"] == {
+        "seconds": [calendar.timegm((2024, 3, 1, 0, 0, 0))],
+        "counts": [2],
+    }
+
+
+def test_span_includes_lines_without_requests():
+    result = _scan_bytes(
+        b"2024-01-24 10:15:00.000 INFO Service started\n"
+        b"2024-01-24 10:15:05.000 INFO Request processed in 5ms\n"
+        b"2024-01-24 10:15:09.000 ERROR Database connection failed\n"
+    )
+    assert result["first_second"] == calendar.timegm((2024, 1, 24, 10, 15, 0))
+    assert result["last_second"] == calendar.timegm((2024, 1, 24, 10, 15, 9))
+
+
+def test_other_formats():
+    result = _scan_bytes(
+        b'{"timestamp": "2024-01-24 10:15:33.001", "level": "ERROR", "duration_ms": 95}\n'
+        b"192.168.1.1 - - [24/Jan/2024:10:15:34.125] GET /api/data HTTP/1.1 503 105ms\n"
+        b'{"timestamp": "not a time", "duration_ms": 95}\n'
+    )
+    assert result["request_count"] == 2
+    assert result["total_response_time"] == 200
+    assert result["error_count"] == 2
+    assert result["malformed_lines"] == 1
+
+
+def test_access_log_timezone_offset_is_applied():
+    line = b"192.168.1.1 - - [24/Jan/2024:10:15:33%s] GET /api/data HTTP/1.1 200 105ms\n"
+    utc = calendar.timegm((2024, 1, 24, 10, 15, 33))
+    assert _scan_bytes(line % b"")["first_second"] == utc
+    assert _scan_bytes(line % b" +0000")["first_second"] == utc
+    assert _scan_bytes(line % b" +0200")["first_second"] == utc - 7200
+    assert _scan_bytes(line % b".125 -0130")["first_second"] == utc + 5400
+    assert _scan_bytes(line % b" EST")["malformed_lines"] == 1
+    # Month names are matched without regard to case or locale
+    assert _scan_bytes(line.replace(b"Jan", b"JAN") % b"")["first_second"] == utc
+    assert _scan_bytes(line.replace(b"Jan", b"Jun") % b"")["first_second"] != utc
+    assert _scan_bytes(line.replace(b"Jan", b"Jxn") % b"")["malformed_lines"] == 1
+
+
+def test_json_key_order_spacing_and_nesting():
+    result = _scan_bytes(
+        b'{ "meta" : {"level": "ERROR", "timestamp": "x"}, "message": "say \\"}\\" [",'
+        b' "duration_ms" : 95.9, "timestamp" : "2024-01-24 10:15:33.5" , "level":"INFO"}\n'
+        b'{"timestamp": "2024-01-24 10:15:34.001", "duration_ms": 1e2}\n'
+        b'{"timestamp": "2024-01-24 10:15:35.001", "duration_ms": 5\n'
+    )
+    assert result["line_count"] == 3
+    assert result["malformed_lines"] == 1
+    assert result["request_count"] == 1
+    assert result["total_response_time"] == 95
+    assert result["error_count"] == 0
+    assert result["first_second"] == calendar.timegm((2024, 1, 24, 10, 15, 33))
+    assert result["last_second"] == calendar.timegm((2024, 1, 24, 10, 15, 34))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_scan_matches_reference(seed):
+    rng = random.Random(seed)
+    data = b"\n".join(_random_line(rng) for _ in range(rng.randint(0, 400)))
+    if rng.random() < 0.5:
+        data += b"\n"
+    result = _scan_bytes(data)
+    expected = _reference_scan(data)
+    assert {key: result[key] for key in expected} == expected
+
+
+def _request_counts(seconds: list, counts: list) -> dict:
+    return {"worker_id": "w", "request_count_per_second": {"seconds": seconds, "counts": counts}}
+
+
+def test_request_ring_recycles_old_seconds():
+    analyzer = Analyzer()
+    analyzer.update_metrics(_request_counts([10, 11], [3, 1]))
+    analyzer.update_metrics(_request_counts([10], [2]))
+    assert analyzer.buckets[10] == 5
+    assert analyzer.peak_requests_per_second == 5
+
+    # Moving a full window ahead reuses slot 10, and the old count is cleared first
+    later = 10 + REQUEST_BUCKET_CAPACITY
+    analyzer.update_metrics(_request_counts([later], [1]))
+    assert analyzer.buckets[10] == 1
+    assert analyzer.buckets[11] == 1
+    # Seconds that have fallen out of the window no longer land in the ring
+    analyzer.update_metrics(_request_counts([10], [7]))
+    assert analyzer.buckets[10] == 1
+    assert analyzer.peak_requests_per_second == 5
+
+
+def test_chunk_bounds_assign_each_line_once(tmp_path):
+    data = b"first line\n\nsecond\nthird line here\nno trailing newline"
+    path = tmp_path / "chunks.log"
+    path.write_bytes(data)
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for size in range(1, len(data) + 2):
+            pieces = []
+            for start in range(0, len(data), size):
+                begin, end = _chunk_bounds(mm, start, size)
+                assert begin == end or begin == 0 or data[begin - 1] == ord("\n")
+                pieces.append(data[begin:end])
+            assert b"".join(pieces) == data
+        assert _chunk_bounds(mm, len(data) + 10, 5) == (len(data), len(data))
+
+
+def test_report_results_batches(monkeypatch):
+    worker = Worker(port=0, worker_id="w", coordinator_url="http://localhost:0")
+    sent = []
+
+    async def flush() -> bool:
+        batch, worker._pending = worker._pending, []
+        sent.append(batch)
+        return True
+
+    monkeypatch.setattr(worker, "_flush_results", flush)
+
+    async def report() -> None:
+        for index in range(REPORT_BATCH_SIZE + 1):
+            await worker.report_results({"chunk_id": str(index)})
+        assert worker._flush_task is not None
+        await worker._flush_task
+
+    try:
+        asyncio.run(report())
+    finally:
+        worker.pool.shutdown()
+    assert [len(batch) for batch in sent] == [REPORT_BATCH_SIZE, 1]
+
+
+class _RefusingSession:
+    def post(self, *args, **kwargs):
+        raise aiohttp.ClientConnectionError("refused")
+
+
+def test_failed_report_is_requeued(monkeypatch):
+    worker = Worker(port=0, worker_id="w", coordinator_url="http://localhost:0")
+    monkeypatch.setattr(worker, "session", _RefusingSession())
+    worker._pending = [{"chunk_id": "a"}, {"chunk_id": "b"}]
+
+    async def flush() -> bool:
+        worker._pending.append({"chunk_id": "c"})
+        delivered = await worker._flush_results()
+        worker._pending.append({"chunk_id": "d"})
+        return delivered
+
+    try:
+        assert asyncio.run(flush()) is False
+    finally:
+        worker.pool.shutdown()
+    assert [item["chunk_id"] for item in worker._pending] == ["a", "b", "c", "d"]
@@ -1,4 +1,631 @@
 import argparse
+import asyncio
+import logging
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Set
+
+import aiohttp
+import numpy as np
+import orjson
+from aiohttp import web
+from numba import njit, types
+
+try:
+    import uvloop
+except ImportError:  # uvloop does not support Windows
+    uvloop = None  # type: ignore[assignment]
+
+from logging_config import setup_logging
+
+HEARTBEAT_INTERVAL = 5  # seconds
+REPORT_BATCH_SIZE = 32
+REPORT_BATCH_DELAY = 0.05  # seconds
+
+logger = logging.getLogger(__name__)
+
+# "0" marks a digit position, every other byte must match exactly
+TIMESTAMP_SHAPE = np.frombuffer(b"0000-00-00 00:00:00.000 ", dtype=np.uint8)
+RESPONSE_MARKER = np.frombuffer(b"processed in ", dtype=np.uint8)
+DAYS_BEFORE_MONTH = np.array([0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334], dtype=np.int64)
+DAYS_IN_MONTH = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=np.int64)
+LEVEL_OFFSET = 24
+INITIAL_RUN_CAPACITY = 64
+
+# JSON keys read from structured lines, and month names for access-log dates
+TIMESTAMP_KEY = np.frombuffer(b"timestamp", dtype=np.uint8)
+LEVEL_KEY = np.frombuffer(b"level", dtype=np.uint8)
+DURATION_KEY = np.frombuffer(b"duration_ms", dtype=np.uint8)
+ERROR_LEVEL = np.frombuffer(b"ERROR", dtype=np.uint8)
+# As TIMESTAMP_SHAPE, with "a" marking a letter of the month name
+ACCESS_TIMESTAMP_SHAPE = np.frombuffer(b"00/aaa/0000:00:00:00", dtype=np.uint8)
+MONTH_NAMES = np.frombuffer(b"janfebmaraprmayjunjulaugsepoctnovdec", dtype=np.uint8)
+
+# Explicit signatures compile _scan eagerly at import (or load it from the on-disk
+# cache), so pool processes never pay the JIT cost on their first chunk. Chunk views
+# are read-only when they come from mmap or bytes; writable arrays are accepted too.
+SCAN_SIGNATURES = [
+    types.Tuple((types.int64,) * 8 + (types.int64[::1],) * 2)(
+        types.Array(types.uint8, 1, "C", readonly=readonly)
+    )
+    for readonly in (True, False)
+]
+
+
+@njit(cache=True)
+def _is_word_byte(byte):
+    return (
+        48 <= byte <= 57 or 65 <= byte <= 90 or 97 <= byte <= 122 or byte == 95
+    )
+
+
+@njit(cache=True)
+def _digits(buf, pos, width):
+    value = 0
+    for i in range(pos, pos + width):
+        value = value * 10 + (buf[i] - 48)
+    return value
+
+
+@njit(cache=True)
+def _leap_days_before(year):
+    year -= 1
+    return year // 4 - year // 100 + year // 400
+
+
+@njit(cache=True)
+def _is_leap(year):
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+@njit(cache=True)
+def _valid_date(year, month, day):
+    if month < 1 or month > 12 or day < 1:
+        return False
+    return day <= DAYS_IN_MONTH[month - 1] + (1 if month == 2 and _is_leap(year) else 0)
+
+
+@njit(cache=True)
+def _epoch_day(year, month, day):
+    leap = _is_leap(year)
+    return (
+        (year - 1970) * 365
+        + _leap_days_before(year)
+        - _leap_days_before(1970)
+        + DAYS_BEFORE_MONTH[month - 1]
+        + (1 if leap and month > 2 else 0)
+        + day
+        - 1
+    )
+
+
+@njit(cache=True)
+def _is_space(byte):
+    return byte == 32 or 9 <= byte <= 13
+
+
+@njit(cache=True)
+def _is_digit(byte):
+    return 48 <= byte <= 57
+
+
+@njit(cache=True)
+def _equals_at(buf, pos, end, token):
+    if pos + token.shape[0] > end:
+        return False
+    for j in range(token.shape[0]):
+        if buf[pos + j] != token[j]:
+            return False
+    return True
+
+
+@njit(cache=True)
+def _civil_second(year, month, day, hour, minute, second):
+    """Return (valid, epoch second) for UTC civil time fields, range-checked"""
+    if not (_valid_date(year, month, day) and hour < 24 and minute < 60 and second < 61):
+        return False, 0
+    return True, _epoch_day(year, month, day) * 86400 + hour * 3600 + minute * 60 + second
+
+
+@njit(cache=True)
+def _grow(values):
+    grown = np.empty(values.shape[0] * 2, dtype=values.dtype)
+    grown[: values.shape[0]] = values
+    return grown
+
+
+@njit(cache=True)
+def _add_request(run_seconds, run_counts, run_count, second):
+    # Consecutive requests within one second extend a single (second, count) run
+    if run_count > 0 and run_seconds[run_count - 1] == second:
+        run_counts[run_count - 1] += 1
+        return run_seconds, run_counts, run_count
+    if run_count == run_seconds.shape[0]:
+        run_seconds = _grow(run_seconds)
+        run_counts = _grow(run_counts)
+    run_seconds[run_count] = second
+    run_counts[run_count] = 1
+    return run_seconds, run_counts, run_count + 1
+
+
+@njit(cache=True)
+def _json_timestamp(buf, pos, end):
+    """Parse a quoted "YYYY-MM-DD HH:MM:SS.f" value; returns (valid, second, end of value)
+
+    The layout is the primary prefix at fixed offsets, with the 1-6 fraction
+    digits that strptime's %f would take.
+    """
+    if pos + 23 > end or buf[pos] != 34:
+        return False, 0, pos
+    pos += 1
+    for i in range(20):
+        expected = TIMESTAMP_SHAPE[i]
+        byte = buf[pos + i]
+        if expected == 48:
+            if not _is_digit(byte):
+                return False, 0, pos
+        elif byte != expected:
+            return False, 0, pos
+    fraction_end = pos + 20
+    while fraction_end < end and fraction_end < pos + 26 and _is_digit(buf[fraction_end]):
+        fraction_end += 1
+    if fraction_end == pos + 20 or fraction_end >= end or buf[fraction_end] != 34:
+        return False, 0, pos
+    valid, second = _civil_second(
+        _digits(buf, pos, 4),
+        _digits(buf, pos + 5, 2),
+        _digits(buf, pos + 8, 2),
+        _digits(buf, pos + 11, 2),
+        _digits(buf, pos + 14, 2),
+        _digits(buf, pos + 17, 2),
+    )
+    return valid, second, fraction_end + 1
+
+
+@njit(cache=True)
+def _json_int(buf, pos, end):
+    """Read a JSON number truncated toward zero; returns (valid, value)
+
+    Strings, booleans, null and exponent forms are not response times.
+    """
+    negative = pos < end and buf[pos] == 45  # -
+    if negative:
+        pos += 1
+    digits_start = pos
+    value = 0
+    while pos < end and _is_digit(buf[pos]):
+        value = value * 10 + (buf[pos] - 48)
+        pos += 1
+    if pos == digits_start:
+        return False, 0
+    if pos < end and buf[pos] == 46:  # .
+        pos += 1
+        fraction_start = pos
+        while pos < end and _is_digit(buf[pos]):
+            pos += 1
+        if pos == fraction_start:
+            return False, 0
+    if pos < end and (buf[pos] == 101 or buf[pos] == 69):  # e or E
+        return False, 0
+    return True, -value if negative else value
+
+
+@njit(cache=True)
+def _json_line(buf, start, end):
+    """Read timestamp, level and duration_ms from a one-line JSON object.
+
+    Strings are skipped with their escapes and only keys of the outer object
+    count, the last of a repeated key winning. The line is valid when its
+    braces balance, nothing follows the closing brace and the timestamp
+    parses. Returns (valid, second, is_error, has_response, response_time).
+    """
+    depth = 0
+    found = False
+    second = 0
+    is_error = False
+    has_response = False
+    response_time = 0
+    i = start
+    while i < end:
+        byte = buf[i]
+        if byte == 34:  # "
+            key_start = i + 1
+            i = key_start
+            while i < end and buf[i] != 34:
+                i += 2 if buf[i] == 92 else 1  # a backslash escapes the next byte
+            if i >= end:
+                return False, 0, False, False, 0
+            key_end = i
+            i += 1
+            colon = i
+            while colon < end and _is_space(buf[colon]):
+                colon += 1
+            if depth != 1 or colon == end or buf[colon] != 58:  # not a key of the outer object
+                continue
+            value = colon + 1
+            while value < end and _is_space(buf[value]):
+                value += 1
+            key_length = key_end - key_start
+            if key_length == TIMESTAMP_KEY.shape[0] and _equals_at(
+                buf, key_start, key_end, TIMESTAMP_KEY
+            ):
+                found, second, i = _json_timestamp(buf, value, end)
+                if not found:
+                    return False, 0, False, False, 0
+            elif key_length == LEVEL_KEY.shape[0] and _equals_at(
+                buf, key_start, key_end, LEVEL_KEY
+            ):
+                is_error = (
+                    value + 7 <= end
+                    and buf[value] == 34
+                    and _equals_at(buf, value + 1, end, ERROR_LEVEL)
+                    and buf[value + 6] == 34
+                )
+            elif key_length == DURATION_KEY.shape[0] and _equals_at(
+                buf, key_start, key_end, DURATION_KEY
+            ):
+                has_response, response_time = _json_int(buf, value, end)
+            continue
+        if byte == 123 or byte == 91:  # { or [
+            depth += 1
+        elif byte == 125 or byte == 93:  # } or ]
+            depth -= 1
+            if depth <= 0:
+                valid = depth == 0 and found and i + 1 == end
+                return valid, second, is_error, has_response, response_time
+        i += 1
+    return False, 0, False, False, 0
+
+
+@njit(cache=True)
+def _access_line(buf, start, end):
+    """Read a line like 'host ident user [24/Jan/2024:10:15:33 +0200] ... 200 105ms'.
+
+    The bracketed time may carry a fraction and a +hhmm/-hhmm offset, which is
+    applied so the line buckets by UTC second; anything else inside the
+    brackets is rejected. 5xx statuses count as errors, as the format has no
+    level. Returns (valid, second, is_error, response_time).
+    """
+    i = start
+    for _ in range(3):
+        token_start = i
+        while i < end and not _is_space(buf[i]):
+            i += 1
+        if i == token_start or i == end or buf[i] != 32:
+            return False, 0, False, 0
+        i += 1
+    shape_length = ACCESS_TIMESTAMP_SHAPE.shape[0]
+    if i + shape_length + 2 > end or buf[i] != 91:  # [
+        return False, 0, False, 0
+    i += 1
+    for j in range(shape_length):
+        expected = ACCESS_TIMESTAMP_SHAPE[j]
+        byte = buf[i + j]
+        if expected == 48:
+            if not _is_digit(byte):
+                return False, 0, False, 0
+        elif expected == 97:
+            if not (65 <= byte <= 90 or 97 <= byte <= 122):
+                return False, 0, False, 0
+        elif byte != expected:
+            return False, 0, False, 0
+    month = 0
+    for index in range(12):
+        if (
+            (buf[i + 3] | 32) == MONTH_NAMES[3 * index]
+            and (buf[i + 4] | 32) == MONTH_NAMES[3 * index + 1]
+            and (buf[i + 5] | 32) == MONTH_NAMES[3 * index + 2]
+        ):
+            month = index + 1
+            break
+    valid, second = _civil_second(
+        _digits(buf, i + 7, 4),
+        month,
+        _digits(buf, i, 2),
+        _digits(buf, i + 12, 2),
+        _digits(buf, i + 15, 2),
+        _digits(buf, i + 18, 2),
+    )
+    if not valid:
+        return False, 0, False, 0
+    i += shape_length
+    if i < end and buf[i] == 46:  # .
+        i += 1
+        fraction_start = i
+        while i < end and _is_digit(buf[i]):
+            i += 1
+        if i == fraction_start:
+            return False, 0, False, 0
+    if i + 6 <= end and buf[i] == 32 and (buf[i + 1] == 43 or buf[i + 1] == 45):  # + or -
+        for j in range(i + 2, i + 6):
+            if not _is_digit(buf[j]):
+                return False, 0, False, 0
+        hours = _digits(buf, i + 2, 2)
+        minutes = _digits(buf, i + 4, 2)
+        if hours >= 24 or minutes >= 60:
+            return False, 0, False, 0
+        offset = hours * 3600 + minutes * 60
+        second += -offset if buf[i + 1] == 43 else offset
+        i += 6
+    if i == end or buf[i] != 93:  # ]
+        return False, 0, False, 0
+    bracket = i
+
+    # The line ends with " <status> <n>ms", and some text sits between it and the bracket
+    if end - 2 <= bracket or buf[end - 2] != 109 or buf[end - 1] != 115:  # ms
+        return False, 0, False, 0
+    digits_start = end - 2
+    while digits_start > bracket and _is_digit(buf[digits_start - 1]):
+        digits_start -= 1
+    status_start = digits_start - 4
+    if (
+        digits_start == end - 2
+        or status_start - 1 < bracket + 2
+        or buf[bracket + 1] != 32
+        or buf[status_start - 1] != 32
+        or buf[digits_start - 1] != 32
+    ):
+        return False, 0, False, 0
+    for j in range(status_start, status_start + 3):
+        if not _is_digit(buf[j]):
+            return False, 0, False, 0
+    status = _digits(buf, status_start, 3)
+    return True, second, status >= 500, _digits(buf, digits_start, end - 2 - digits_start)
+
+
+@njit(cache=True)
+def _other_line(buf, start, end):
+    """Parse a non-blank JSON or access-log line, ignoring surrounding whitespace.
+
+    Returns (valid, second, is_error, has_response, response_time).
+    """
+    while _is_space(buf[start]):
+        start += 1
+    while _is_space(buf[end - 1]):
+        end -= 1
+    if buf[start] == 123:  # {
+        return _json_line(buf, start, end)
+    valid, second, is_error, response_time = _access_line(buf, start, end)
+    return valid, second, is_error, valid, response_time
+
+
+@njit(SCAN_SIGNATURES, cache=True, boundscheck=False)
+def _scan(buf):
+    """Walk newline-delimited records and accumulate chunk counters.
+
+    Each line is read once, front to back: the timestamp shape, field ranges
+    and level are checked at fixed offsets, then a single forward pass to the newline picks
+    up the first "processed in <n>ms". Requests are bucketed by epoch second
+    as they are found: each run of consecutive requests within one second
+    becomes one (second, count) entry, so memory follows the number of
+    distinct seconds rather than the number of lines. The earliest and latest
+    second of any well-formed line are tracked too, as the chunk's time span.
+
+    Non-blank lines not in the primary format go through _other_line as JSON
+    or access-log records in the same pass, and count as malformed when they
+    are neither. Returns (line_count, malformed_count, error_count,
+    request_count, total_response_time, has_span, first_second, last_second,
+    run_seconds, run_counts); the span is only meaningful when has_span is 1.
+    """
+    n = buf.shape[0]
+    marker_len = RESPONSE_MARKER.shape[0]
+    line_count = 0
+    malformed_count = 0
+    error_count = 0
+    request_count = 0
+    total_response_time = 0
+    run_seconds = np.empty(INITIAL_RUN_CAPACITY, dtype=np.int64)
+    run_counts = np.empty(INITIAL_RUN_CAPACITY, dtype=np.int64)
+    run_count = 0
+    has_span = False
+    first_second = 0
+    last_second = 0
+    # Consecutive lines almost always share a date, so memoize the last one
+    last_date = -1
+    last_epoch_day = 0
+
+    start = 0
+    while start < n:
+        # The shape never contains a newline, so this check cannot run past the line
+        well_formed = start + LEVEL_OFFSET < n
+        if well_formed:
+            for i in range(LEVEL_OFFSET):
+                expected = TIMESTAMP_SHAPE[i]
+                byte = buf[start + i]
+                if expected == 48:
+                    if byte < 48 or byte > 57:
+                        well_formed = False
+                        break
+                elif byte != expected:
+                    well_formed = False
+                    break
+        level_end = start + LEVEL_OFFSET
+        if well_formed:
+            while level_end < n and _is_word_byte(buf[level_end]):
+                level_end += 1
+            well_formed = (
+                level_end > start + LEVEL_OFFSET and level_end < n and buf[level_end] == 32
+            )
+        second = 0
+        if well_formed:
+            year = _digits(buf, start, 4)
+            month = _digits(buf, start + 5, 2)
+            day = _digits(buf, start + 8, 2)
+            hour = _digits(buf, start + 11, 2)
+            minute = _digits(buf, start + 14, 2)
+            second = _digits(buf, start + 17, 2)
+            # Range checks also keep month inside DAYS_BEFORE_MONTH, as bounds are not checked
+            well_formed = (
+                _valid_date(year, month, day) and hour < 24 and minute < 60 and second < 61
+            )
+            if well_formed:
+                date = year * 10000 + month * 100 + day
+                if date != last_date:
+                    last_date = date
+                    last_epoch_day = _epoch_day(year, month, day)
+                second += last_epoch_day * 86400 + hour * 3600 + minute * 60
+        if not well_formed:
+            end = start
+            blank = True
+            while end < n and buf[end] != 10:
+                byte = buf[end]
+                if blank and byte != 32 and not 9 <= byte <= 13:
+                    blank = False
+                end += 1
+            if not blank:
+                line_count += 1
+                valid, line_second, is_error, has_response, response_time = _other_line(
+                    buf, start, end
+                )
+                if not valid:
+                    malformed_count += 1
+                else:
+                    if not has_span or line_second < first_second:
+                        first_second = line_second
+                    if not has_span or line_second > last_second:
+                        last_second = line_second
+                    has_span = True
+                    if is_error:
+                        error_count += 1
+                    if has_response:
+                        run_seconds, run_counts, run_count = _add_request(
+                            run_seconds, run_counts, run_count, line_second
+                        )
+                        request_count += 1
+                        total_response_time += response_time
+            start = end + 1
+            continue
+        if not has_span or second < first_second:
+            first_second = second
+        if not has_span or second > last_second:
+            last_second = second
+        has_span = True
+        line_count += 1
+
+        level = start + LEVEL_OFFSET
+        if (
+            level_end - level == 5
+            and buf[level] == 69  # E
+            and buf[level + 1] == 82  # R
+            and buf[level + 2] == 82  # R
+            and buf[level + 3] == 79  # O
+            and buf[level + 4] == 82  # R
+        ):
+            error_count += 1
+
+        found = False
+        i = level_end + 1
+        while i < n and buf[i] != 10:
+            if (
+                not found
+                and buf[i] == RESPONSE_MARKER[0]
+                and _equals_at(buf, i, n, RESPONSE_MARKER)
+            ):
+                k = i + marker_len
+                value = 0
+                while k < n and 48 <= buf[k] <= 57:
+                    value = value * 10 + (buf[k] - 48)
+                    k += 1
+                if k > i + marker_len and k + 1 < n and buf[k] == 109 and buf[k + 1] == 115:
+                    found = True
+                    if run_count > 0 and run_seconds[run_count - 1] == second:
+                        run_counts[run_count - 1] += 1
+                    else:
+                        if run_count == run_seconds.shape[0]:
+                            run_seconds = _grow(run_seconds)
+                            run_counts = _grow(run_counts)
+                        run_seconds[run_count] = second
+                        run_counts[run_count] = 1
+                        run_count += 1
+                    request_count += 1
+                    total_response_time += value
+                    i = k + 2
+                    continue
+            i += 1
+
+        start = i + 1
+
+    return (
+        line_count,
+        malformed_count,
+        error_count,
+        request_count,
+        total_response_time,
+        1 if has_span else 0,
+        first_second,
+        last_second,
+        run_seconds[:run_count],
+        run_counts[:run_count],
+    )
+
+
+def _chunk_bounds(mm: mmap.mmap, start: int, size: int) -> tuple:
+    """Return the byte range covering the lines that start inside [start, start + size)"""
+    length = len(mm)
+    if start >= length:
+        return length, length
+    begin = start
+    end = min(start + size, length)
+    if start > 0 and mm[start - 1] != ord("\n"):
+        # A line belongs to the chunk it starts in, so skip a partial first line
+        newline = mm.find(b"\n", start)
+        begin = length if newline == -1 else newline + 1
+    if begin >= end:
+        return begin, begin
+    if end < length and mm[end - 1] != ord("\n"):
+        newline = mm.find(b"\n", end)
+        end = length if newline == -1 else newline + 1
+    return begin, end
+
+
+def _process_file_chunk(filepath: str, start: int, size: int) -> dict:
+    """Map a log file read-only and scan one chunk of it in place"""
+    with open(filepath, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return _parse_chunk(np.empty(0, dtype=np.uint8))
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            begin, end = _chunk_bounds(mm, start, size)
+            buf = np.frombuffer(mm, dtype=np.uint8, count=end - begin, offset=begin)
+            try:
+                return _parse_chunk(buf)
+            finally:
+                # The mapping cannot close while a view still exports its buffer
+                del buf
+
+
+def _parse_chunk(buf: np.ndarray) -> dict:
+    """Scan a uint8 view of raw log bytes and return the chunk metrics"""
+    (
+        line_count,
+        malformed_lines,
+        error_count,
+        request_count,
+        total_response_time,
+        has_span,
+        first_second,
+        last_second,
+        run_seconds,
+        run_counts,
+    ) = _scan(buf)
+
+    # Sparse per-second request counts; runs of one second repeat if timestamps go backwards
+    seconds, slots = np.unique(run_seconds, return_inverse=True)
+    counts = np.zeros(seconds.size, dtype=np.int64)
+    np.add.at(counts, slots, run_counts)
+
+    return {
+        "line_count": int(line_count),
+        "malformed_lines": int(malformed_lines),
+        "request_count": int(request_count),
+        "error_count": int(error_count),
+        "total_response_time": int(total_response_time),
+        "first_second": int(first_second) if has_span else None,
+        "last_second": int(last_second) if has_span else None,
+        "request_count_per_second": {"seconds": seconds.tolist(), "counts": counts.tolist()},
+    }
 
 
 class Worker:
@@ -8,26 +635,170 @@ class Worker:
         self.worker_id = worker_id
         self.coordinator_url = coordinator_url
         self.port = port
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._pending: List[dict] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        # Chunk scanning is CPU bound, so keep it off the event loop and across cores
+        self.pool = ProcessPoolExecutor(max_workers=os.cpu_count())
     
     def start(self) -> None:
         """Start worker server"""
-        print(f"Starting worker {self.worker_id} on port {self.port}...")
-        pass
+        logger.info("Starting worker %s on port %d...", self.worker_id, self.port)
+        app = web.Application()
+        app.router.add_post("/process_chunk", self.process_chunk_handler)
+        app.router.add_get("/health", self.health_handler)
+        app.on_startup.append(self._on_startup)
+        app.on_cleanup.append(self._on_cleanup)
+        web.run_app(
+            app,
+            port=self.port,
+            access_log=None,
+            loop=uvloop.new_event_loop() if uvloop else None,
+        )
+
+    async def _on_startup(self, app: web.Application) -> None:
+        self._spawn(self._heartbeat_loop())
+
+    async def _on_cleanup(self, app: web.Application) -> None:
+        flush_task = self._flush_task
+        for task in list(self._tasks):
+            if task is not flush_task:
+                task.cancel()
+        # Let an in-flight report finish, then send whatever is still queued
+        if flush_task is not None:
+            await flush_task
+        await self._flush_results()
+        if self.session is not None:
+            await self.session.close()
+        # Joining the pool blocks until running scans finish, so keep it off the loop
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self.session is None:
+            self.session = aiohttp.ClientSession()
+        return self.session
+
+    def _spawn(self, coro) -> asyncio.Task:
+        # Keep a reference so background tasks are not garbage collected mid-flight
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def process_chunk_handler(self, request: web.Request) -> web.Response:
+        """Accept a chunk assignment and process it in the background"""
+        try:
+            data = orjson.loads(await request.read())
+            job = {key: data[key] for key in ("chunk_id", "filepath", "start", "size")}
+        except (KeyError, TypeError, ValueError) as e:
+            raise web.HTTPBadRequest(text=f"Invalid chunk assignment: {e!r}")
+        self._spawn(self._run_job(job))
+        return web.Response(
+            status=202, body=orjson.dumps({"status": "accepted"}), content_type="application/json"
+        )
+
+    async def health_handler(self, request: web.Request) -> web.Response:
+        """Report that the worker is alive"""
+        return web.Response(
+            body=orjson.dumps({"worker_id": self.worker_id, "status": "ok"}),
+            content_type="application/json",
+        )
+
+    async def _run_job(self, job: dict) -> None:
+        try:
+            metrics = await self.process_chunk(job["filepath"], job["start"], job["size"])
+        except Exception as e:
+            # Report every failure so the coordinator never waits on a chunk that vanished
+            logger.exception("Worker %s failed chunk %s", self.worker_id, job["chunk_id"])
+            await self.report_results(
+                {
+                    "worker_id": self.worker_id,
+                    "chunk_id": job["chunk_id"],
+                    "error": f"{type(e).__name__}: {e}",
+                }
+            )
+            return
+        await self.report_results(
+            {"worker_id": self.worker_id, "chunk_id": job["chunk_id"], **metrics}
+        )
 
     async def process_chunk(self, filepath: str, start: int, size: int) -> dict:
         """Process a chunk of log file and return metrics"""
-        pass
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.pool, _process_file_chunk, filepath, start, size)
+
+    async def report_results(self, results: dict) -> None:
+        """Queue chunk metrics for the next batched report to coordinator"""
+        self._pending.append(results)
+        if len(self._pending) >= REPORT_BATCH_SIZE:
+            await self._flush_results()
+        elif self._flush_task is None:
+            self._flush_task = self._spawn(self._flush_after_delay())
+
+    async def _flush_after_delay(self) -> None:
+        await asyncio.sleep(REPORT_BATCH_DELAY)
+        try:
+            # Results queued while a batch was in flight go out straight after it
+            while self._pending and await self._flush_results():
+                pass
+        finally:
+            self._flush_task = None
+
+    async def _flush_results(self) -> bool:
+        batch, self._pending = self._pending, []
+        if not batch:
+            return True
+        try:
+            async with self._get_session().post(
+                f"{self.coordinator_url}/report_results",
+                data=orjson.dumps({"batch": batch}),
+                headers={"Content-Type": "application/json"},
+            ) as response:
+                response.raise_for_status()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error("Worker %s failed to report %d results: %s", self.worker_id, len(batch), e)
+            self._pending[:0] = batch
+            return False
+        except asyncio.CancelledError:
+            self._pending[:0] = batch
+            raise
+        return True
 
     async def report_health(self) -> None:
         """Send heartbeat to coordinator"""
-        pass
+        async with self._get_session().post(
+            f"{self.coordinator_url}/heartbeat",
+            data=orjson.dumps(
+                {"worker_id": self.worker_id, "url": f"http://localhost:{self.port}"}
+            ),
+            headers={"Content-Type": "application/json"},
+        ) as response:
+            response.raise_for_status()
+
+    async def _heartbeat_loop(self) -> None:
+        while True:
+            try:
+                await self.report_health()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning("Worker %s heartbeat failed: %s", self.worker_id, e)
+            else:
+                # Retry any results a failed report left queued
+                if self._pending and self._flush_task is None:
+                    await self._flush_results()
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Log Analyzer Coordinator")
     parser.add_argument("--port", type=int, default=8000, help="Coordinator port")
     parser.add_argument("--id", type=str, default="worker1", help="Worker ID")
     parser.add_argument("--coordinator", type=str, default="http://localhost:8000", help="Coordinator URL")
+    parser.add_argument("--log-level", type=str, default="INFO", help="Logging level")
     args = parser.parse_args()
 
-    worker = Worker(port=args.port, worker_id=args.id, coordinator_url=args.coordinator)
-    worker.start()
+    listener = setup_logging(args.log_level)
+    try:
+        worker = Worker(port=args.port, worker_id=args.id, coordinator_url=args.coordinator)
+        worker.start()
+    finally:
+        listener.stop()